@@ -1,5 +1,38 @@
 __version__ = "0.1.0"
 
-from .translator import translate, translate_batch
+from .translator import translate, translate_batch, translate_rows
 
-__all__ = ["translate", "translate_batch", "__version__"]
+__all__ = [
+    "translate",
+    "translate_batch",
+    "translate_rows",
+    "extract",
+    "iter_extract",
+    "iter_extract_rows",
+    "apply",
+    "apply_text",
+    "__version__",
+]
+
+# parser/applier는 CLI로도 실행되므로(python -m unity_unite_translator.parser)
+# 패키지 임포트 시점에 미리 임포트하면 runpy가 "found in sys.modules" 경고를 낸다.
+# 그래서 이 둘의 export만 처음 접근할 때 임포트한다.
+_LAZY = {
+    "extract": "parser",
+    "iter_extract": "parser",
+    "iter_extract_rows": "parser",
+    "apply": "applier",
+    "apply_text": "applier",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        from importlib import import_module
+
+        return getattr(import_module(f".{_LAZY[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
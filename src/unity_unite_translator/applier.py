@@ -1,35 +1,69 @@
 # apply_rpgmaker_texts.py
 import csv, io, os, sys
+from collections.abc import Iterable, Mapping
 
 # 프로젝트 루트 설정
 PROJECT_ROOT = "projects"
-PROJECT_NAME = input("프로젝트 이름을 입력하세요: ").strip()
-CSV_PATH = os.path.join(PROJECT_ROOT, PROJECT_NAME, "rpgm_texts.csv")
 
-# CSV: file,source,target
-replacements = {}
 
-# CSV 파일 확인
-if not os.path.exists(CSV_PATH):
-    print(f"오류: CSV 파일을 찾을 수 없습니다: {CSV_PATH}")
-    sys.exit(1)
-
-with io.open(CSV_PATH, "r", encoding="utf-8", newline="") as f:
-    import csv as _csv
-
-    r = _csv.DictReader(f)
-    for row in r:
+def load_replacements(
+    rows: Iterable[Mapping[str, str]],
+) -> dict[str, list[tuple[str, str]]]:
+    """
+    file,source,target 행들을 파일별 (source, target) 목록으로 묶는다.
+    target이 비어 있는 행은 무시한다.
+    """
+    replacements = {}
+    for row in rows:
         if not row.get("target"):
             continue
         replacements.setdefault(row["file"], []).append((row["source"], row["target"]))
+    return replacements
 
-for path, pairs in replacements.items():
-    with io.open(path, "r", encoding="utf-8") as f:
-        s = f.read()
+
+def apply_text(s: str, pairs: Iterable[tuple[str, str]]) -> str:
+    """에셋 텍스트 하나에 (source, target) 치환을 적용한 결과를 반환한다."""
     for src, tgt in pairs:
         # YAML 내부의 "src"를 정확히 치환(따옴표 포함 라인 보존)
         # src/tgt는 이미 \n, \" 등 이스케이프된 형태라고 가정
         s = s.replace(f'- "{src}"', f'- "{tgt}"')
-    with io.open(path, "w", encoding="utf-8", newline="\n") as f:
-        f.write(s)
-print("applied")
+    return s
+
+
+def apply(rows: Iterable[Mapping[str, str]]) -> list[str]:
+    """
+    번역 행(file,source,target)을 에셋 파일에 적용한다.
+
+    Returns:
+        치환 결과 내용이 실제로 바뀌어 다시 쓴 파일 경로 리스트
+    """
+    changed = []
+    for path, pairs in load_replacements(rows).items():
+        with io.open(path, "r", encoding="utf-8") as f:
+            s = f.read()
+        new = apply_text(s, pairs)
+        if new == s:
+            continue
+        with io.open(path, "w", encoding="utf-8", newline="\n") as f:
+            f.write(new)
+        changed.append(path)
+    return changed
+
+
+def main():
+    project_name = input("프로젝트 이름을 입력하세요: ").strip()
+    csv_path = os.path.join(PROJECT_ROOT, project_name, "rpgm_texts.csv")
+
+    # CSV 파일 확인
+    if not os.path.exists(csv_path):
+        print(f"오류: CSV 파일을 찾을 수 없습니다: {csv_path}")
+        sys.exit(1)
+
+    # CSV: file,source,target
+    with io.open(csv_path, "r", encoding="utf-8", newline="") as f:
+        apply(csv.DictReader(f))
+    print("applied")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,8 +3,6 @@
 # pip install pycryptodome
 import argparse, sys
 from base64 import b64decode, b64encode
-from Crypto.Cipher import AES
-from Crypto.Random import get_random_bytes
 
 MAGIC = b"TCSV1"  # 헤더: MAGIC(5) + IV(16) + CIPHERTEXT
 
@@ -12,6 +10,21 @@ def pkcs7_pad(data: bytes, block: int = 16) -> bytes:
     pad = block - (len(data) % block)
     return data + bytes([pad]) * pad
 
+def _crypto():
+    """pycryptodome은 실제로 필요할 때만 임포트"""
+    from Crypto.Cipher import AES
+    from Crypto.Random import get_random_bytes
+
+    return AES, get_random_bytes
+
+def encrypt(plain: bytes, key: bytes, iv: bytes | None = None) -> bytes:
+    """plain → MAGIC + IV + CIPHERTEXT (AES-256-CBC). iv를 생략하면 새로 생성"""
+    AES, get_random_bytes = _crypto()
+    if iv is None:
+        iv = get_random_bytes(16)
+    cipher = AES.new(key, AES.MODE_CBC, iv=iv)
+    return MAGIC + iv + cipher.encrypt(pkcs7_pad(plain, 16))
+
 def main():
     ap = argparse.ArgumentParser(description="translation.csv → translation.csv.enc (AES-256-CBC)")
     ap.add_argument("-i", "--input", default="translation.csv", help="입력 CSV 경로")
@@ -19,6 +32,8 @@ def main():
     ap.add_argument("--key-b64", default="", help="Base64 인코딩된 32바이트 키. 비우면 랜덤 생성")
     args = ap.parse_args()
 
+    _, get_random_bytes = _crypto()
+
     # 키 준비
     if args.key_b64.strip():
         try:
@@ -45,11 +60,9 @@ def main():
         sys.exit(1)
 
     iv = get_random_bytes(16)
-    cipher = AES.new(key, AES.MODE_CBC, iv=iv)
-    ct = cipher.encrypt(pkcs7_pad(plain, 16))
 
     with open(args.output, "wb") as f:
-        f.write(MAGIC + iv + ct)
+        f.write(encrypt(plain, key, iv))
 
     print(f"[OK] {args.output} 생성")
     print(f"IV: {iv.hex()}")
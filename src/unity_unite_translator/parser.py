@@ -5,14 +5,22 @@ RPGMaker Unite 이벤트 에셋에서 문자열 추출 → TXT 생성
 """
 
 import argparse, csv, io, os, re, sys
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
-# --- YAML 로더 준비 ---
-try:
-    import yaml
-except ImportError:
-    sys.stderr.write("[ERROR] PyYAML 미설치. 설치: pip install pyyaml\n")
-    sys.exit(1)
+DEFAULT_CODES = frozenset({401, 402})
+
+# --- YAML 로더 준비 (처음 파싱할 때 임포트) ---
+_yaml = None
+
+
+def _load_yaml_module():
+    global _yaml
+    if _yaml is None:
+        import yaml
+
+        _yaml = yaml
+    return _yaml
 
 
 def load_mono_yaml(text: str):
@@ -24,6 +32,7 @@ def load_mono_yaml(text: str):
     if idx < 0:
         return None
     body = text[idx:]
+    yaml = _load_yaml_module()
     try:
         data = yaml.safe_load(body)
         # data = {'MonoBehaviour': {...}}v
@@ -81,6 +90,156 @@ def collect_files(input_root: Path) -> list[Path]:
     return candidates
 
 
+def read_assets(files: Iterable[Path | str]) -> Iterator[tuple[str, str]]:
+    """
+    .asset 파일들을 순서대로 읽어서 (경로, 내용) 쌍으로 돌려준다.
+    UTF-8로 읽을 수 없는 파일(바이너리 등)은 건너뛴다.
+    """
+    for f in files:
+        try:
+            with io.open(f, "r", encoding="utf-8") as fp:
+                yield str(f), fp.read()
+        except UnicodeDecodeError:
+            continue
+
+
+def _iter_sources(text: str, target_codes: set[int], escape: bool) -> Iterator[str]:
+    mono = load_mono_yaml(text)
+    if not mono:
+        return
+    for idx, code, indent, txt, name in iter_event_texts(mono, target_codes):
+        src = normalize_newlines(txt)
+        yield escape_visible(src) if escape else src
+
+
+def iter_extract(
+    texts: Iterable[str],
+    target_codes: Iterable[int] = DEFAULT_CODES,
+    escape: bool = True,
+) -> Iterator[str]:
+    """
+    메모리에 있는 .asset 텍스트들에서 원문 문자열을 뽑는다. (파일 입출력 없음)
+
+    Args:
+        texts: .asset 파일 내용들
+        target_codes: 추출할 event code들
+        escape: 개행/탭을 \\n/\\t로 바꿀지 여부
+
+    Yields:
+        중복이 제거된 원문 (처음 등장한 순서)
+    """
+    target_codes = set(target_codes)
+    seen = set()
+    for text in texts:
+        for src_out in _iter_sources(text, target_codes, escape):
+            # 기준: 최종 출력문에서 동일한 원문이 두 번 이상 등장해서는 안됨
+            if src_out in seen:
+                continue
+            seen.add(src_out)
+            yield src_out
+
+
+def _mapping_get(node, key: str):
+    for k, v in node.value:
+        if getattr(k, "value", None) == key:
+            return v
+    return None
+
+
+def _iter_quoted_sources(text: str, target_codes: set[int]) -> Iterator[str]:
+    """
+    code ∈ target_codes인 eventCommands의 parameters 중 큰따옴표 문자열을
+    파일에 적힌 그대로(따옴표 안쪽, \\n/\\"/\\uXXXX 등 이스케이프 유지) 뽑는다.
+    applier.apply_text()가 찾는 '- "..."' 형태와 정확히 일치한다.
+    """
+    idx = text.find("MonoBehaviour:")
+    if idx < 0:
+        return
+    body = text[idx:]
+    yaml = _load_yaml_module()
+    try:
+        root = yaml.compose(body, Loader=yaml.SafeLoader)
+    except Exception as e:
+        return
+    node = root
+    for key in ("MonoBehaviour", "dataModel", "eventCommands"):
+        if not isinstance(node, yaml.MappingNode):
+            return
+        node = _mapping_get(node, key)
+    if not isinstance(node, yaml.SequenceNode):
+        return
+    for cmd in node.value:
+        if not isinstance(cmd, yaml.MappingNode):
+            continue
+        code = _mapping_get(cmd, "code")
+        if not isinstance(code, yaml.ScalarNode) or not code.value.isdigit():
+            continue
+        if int(code.value) not in target_codes:
+            continue
+        par = _mapping_get(cmd, "parameters")
+        if not isinstance(par, yaml.SequenceNode):
+            continue
+        for item in par.value:
+            if not isinstance(item, yaml.ScalarNode) or item.style != '"':
+                continue
+            raw = body[item.start_mark.index + 1 : item.end_mark.index - 1]
+            # 여러 줄로 접힌 문자열은 한 줄 치환으로 적용할 수 없으므로 제외
+            if "\n" in raw:
+                continue
+            yield raw
+
+
+def iter_extract_rows(
+    assets: Iterable[tuple[str, str]],
+    target_codes: Iterable[int] = DEFAULT_CODES,
+) -> Iterator[dict[str, str]]:
+    """
+    (경로, 내용) 쌍들에서 원문을 뽑아 applier.apply()에 넘길 수 있는 행으로 만든다.
+    source는 파일에 적힌 큰따옴표 문자열 그대로이며,
+    큰따옴표로 쓰이지 않은 값은 치환할 수 없으므로 건너뛴다.
+
+    Args:
+        assets: read_assets() 등이 돌려주는 (경로, .asset 내용) 쌍들
+        target_codes: 추출할 event code들
+
+    Yields:
+        {"file", "source"} 행. 같은 파일 안에서 중복된 원문은 한 번만 나온다
+    """
+    target_codes = set(target_codes)
+    for path, text in assets:
+        seen = set()
+        for src in _iter_quoted_sources(text, target_codes):
+            if src in seen:
+                continue
+            seen.add(src)
+            yield {"file": path, "source": src}
+
+
+def extract(
+    texts: Iterable[str],
+    target_codes: Iterable[int] = DEFAULT_CODES,
+    escape: bool = True,
+) -> list[str]:
+    """
+    iter_extract() 결과를 문자열 기준으로 정렬해서 반환한다.
+
+    Returns:
+        정렬된 원문 리스트
+    """
+    return sorted(iter_extract(texts, target_codes, escape))
+
+
+def _with_progress(files: list[Path]) -> Iterator[Path]:
+    total_files = len(files)
+    prev_percent = 0
+    for i, f in enumerate(files, start=1):
+        current_percent = (i / total_files) * 100
+        if current_percent - prev_percent >= 1 or i == total_files:
+            print(f"[INFO] Processing {i}/{total_files} ({current_percent:.1f}%)")
+            prev_percent = current_percent
+        yield f
+
+
 def main():
     ap = argparse.ArgumentParser(description="RPGMaker Unite 이벤트 텍스트 추출기")
     ap.add_argument(
@@ -105,6 +264,12 @@ def main():
     )
     args = ap.parse_args()
 
+    try:
+        _load_yaml_module()
+    except ImportError:
+        sys.stderr.write("[ERROR] PyYAML 미설치. 설치: pip install pyyaml\n")
+        sys.exit(1)
+
     if args.gui:
         try:
             import tkinter as tk
@@ -130,51 +295,22 @@ def main():
         if tok.isdigit():
             target_codes.add(int(tok))
     if not target_codes:
-        target_codes = {401, 402}
+        target_codes = set(DEFAULT_CODES)
 
     files = collect_files(input_root)
     if not files:
         sys.stderr.write(f"[WARN] 입력에서 .asset 파일을 찾지 못함: {input_root}\n")
 
-    rows = []
-    seen = set()  # dedupe용 (file,name,source)
-    total_files = len(files)
-    prev_percent = 0
-    for i, f in enumerate(files, start=1):
-        current_percent = (i / total_files) * 100
-        if current_percent - prev_percent >= 1 or i == total_files:
-            print(f"[INFO] Processing {i}/{total_files} ({current_percent:.1f}%)")
-            prev_percent = current_percent
-        try:
-            with io.open(f, "r", encoding="utf-8") as fp:
-                text = fp.read()
-        except UnicodeDecodeError:
-            # 일부 파일이 바이너리일 수 있음 → 스킵
-            continue
-
-        mono = load_mono_yaml(text)
-        if not mono:
-            continue
-
-        for idx, code, indent, txt, name in iter_event_texts(mono, target_codes):
-            src = normalize_newlines(txt)
-            src_out = src if args.no_escape else escape_visible(src)
-
-            # 기준: 최종 csv 출력문에서 동일한 원문이 두 번 이상 등장해서는 안됨
-            key = src_out
-            if key in seen:
-                continue
-            seen.add(key)
-
-            rows.append({"source": src_out, "target": src_out})  # dnSpy용 매핑
-
-    # 정렬(문자열 기준)
-    rows.sort(key=lambda r: r["source"])
+    rows = extract(
+        (text for _, text in read_assets(_with_progress(files))),
+        target_codes,
+        escape=not args.no_escape,
+    )
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
     with io.open(out_path, "w", encoding="utf-8") as fp:
         for r in rows:
-            fp.write(r["source"] + "\n")
+            fp.write(r + "\n")
 
     print(f"[OK] extracted {len(rows)} lines → {out_path}")
 
@@ -2,9 +2,11 @@
 import urllib.parse
 import urllib.request
 import time
+from collections.abc import Iterable
 
 
-def translate(text: str, base_url: str = "http://localhost:8000", retry: int = 3, delay: float = 0.5) -> str:
+def translate(text: str, base_url: str = "http://localhost:8000", retry: int = 3, delay: float = 0.5,
+              raise_on_error: bool = False) -> str:
     """
     로컬 번역 서버를 통해 텍스트를 번역합니다.
     
@@ -13,9 +15,10 @@ def translate(text: str, base_url: str = "http://localhost:8000", retry: int = 3
         base_url: 번역 서버 URL (기본값: http://localhost:8000)
         retry: 실패 시 재시도 횟수
         delay: 요청 간 대기 시간(초)
+        raise_on_error: True면 실패 시 원문 대신 RuntimeError를 발생
     
     Returns:
-        번역된 텍스트. 실패 시 원문 반환
+        번역된 텍스트. 실패 시 원문 반환 (raise_on_error=False일 때)
     """
     if not text or not text.strip():
         return text
@@ -32,10 +35,14 @@ def translate(text: str, base_url: str = "http://localhost:8000", retry: int = 3
                     return result.strip()
         except Exception as e:
             if attempt == retry - 1:
+                if raise_on_error:
+                    raise RuntimeError(f"번역 실패 ({text[:30]}...): {e}") from e
                 print(f"번역 실패 ({text[:30]}...): {e}")
                 return text
             time.sleep(delay * (attempt + 1))
     
+    if raise_on_error:
+        raise RuntimeError(f"번역 실패 ({text[:30]}...): 서버 응답 오류")
     return text
 
 
@@ -67,3 +74,51 @@ def translate_batch(texts: list[str], base_url: str = "http://localhost:8000",
         print(f"번역 완료: {total}/{total} (100.0%)")
     
     return results
+
+
+def translate_rows(rows: Iterable[dict], base_url: str = "http://localhost:8000",
+                   cache: dict[tuple[str, str], str] | None = None, batch_size: int = 10,
+                   show_progress: bool = True) -> list[dict]:
+    """
+    source 열을 번역해서 target 열을 채웁니다. (rows를 직접 수정)
+    
+    번역에 실패한 원문은 target에 원문을 그대로 넣고 cache에는 저장하지 않으므로,
+    같은 cache를 쓰는 다음 작업에서 다시 번역을 시도합니다.
+    
+    Args:
+        rows: source 키를 가진 행(dict) iterable
+        base_url: 번역 서버 URL
+        cache: (base_url, 원문) → 번역문 캐시. 같은 dict를 넘기면 여러 작업에서 재사용되며,
+               서버(base_url)가 다르면 서로의 번역을 공유하지 않습니다
+        batch_size: 진행상황 표시 주기
+        show_progress: 진행상황 표시 여부
+    
+    Returns:
+        target이 채워진 행 리스트
+    """
+    rows = list(rows)
+    if cache is None:
+        cache = {}
+    
+    # 캐시에 없는 원문만 한 번씩 번역
+    pending = list(dict.fromkeys(
+        row["source"] for row in rows if (base_url, row["source"]) not in cache
+    ))
+    total = len(pending)
+    
+    for i, text in enumerate(pending, 1):
+        try:
+            cache[(base_url, text)] = translate(text, base_url, raise_on_error=True)
+        except RuntimeError as e:
+            print(e)
+        
+        if show_progress and i % batch_size == 0:
+            print(f"번역 진행: {i}/{total} ({i/total*100:.1f}%)")
+    
+    if show_progress and total and total % batch_size != 0:
+        print(f"번역 완료: {total}/{total} (100.0%)")
+    
+    for row in rows:
+        row["target"] = cache.get((base_url, row["source"]), row["source"])
+    
+    return rows